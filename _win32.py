@@ -0,0 +1,134 @@
+"""Win32 bindings used by script.py, prototyped once at import (Windows only)."""
+import ctypes
+import threading
+from ctypes import wintypes
+
+UOI_NAME = 2
+DESKTOP_READOBJECTS = 0x0001
+DESKTOP_SWITCHDESKTOP = 0x0100
+
+_user32 = ctypes.WinDLL("user32", use_last_error=True)
+
+LockWorkStation = _user32.LockWorkStation
+LockWorkStation.argtypes = ()
+LockWorkStation.restype = wintypes.BOOL
+
+OpenInputDesktop = _user32.OpenInputDesktop
+OpenInputDesktop.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+OpenInputDesktop.restype = wintypes.HANDLE
+
+GetUserObjectInformationW = _user32.GetUserObjectInformationW
+GetUserObjectInformationW.argtypes = (wintypes.HANDLE, ctypes.c_int, wintypes.LPVOID,
+                                      wintypes.DWORD, wintypes.LPDWORD)
+GetUserObjectInformationW.restype = wintypes.BOOL
+
+CloseDesktop = _user32.CloseDesktop
+CloseDesktop.argtypes = (wintypes.HANDLE,)
+CloseDesktop.restype = wintypes.BOOL
+
+# --- session lock/unlock notifications (WTSRegisterSessionNotification) ---
+
+WM_WTSSESSION_CHANGE = 0x02B1
+WTS_SESSION_LOCK = 0x7
+WTS_SESSION_UNLOCK = 0x8
+NOTIFY_FOR_THIS_SESSION = 0
+
+LRESULT = wintypes.LPARAM
+WNDPROC = ctypes.WINFUNCTYPE(LRESULT, wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM)
+
+class WNDCLASSW(ctypes.Structure):
+    _fields_ = [
+        ("style", wintypes.UINT),
+        ("lpfnWndProc", WNDPROC),
+        ("cbClsExtra", ctypes.c_int),
+        ("cbWndExtra", ctypes.c_int),
+        ("hInstance", wintypes.HINSTANCE),
+        ("hIcon", wintypes.HICON),
+        ("hCursor", wintypes.HICON),
+        ("hbrBackground", wintypes.HBRUSH),
+        ("lpszMenuName", wintypes.LPCWSTR),
+        ("lpszClassName", wintypes.LPCWSTR),
+    ]
+
+_kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+_wtsapi32 = ctypes.WinDLL("wtsapi32", use_last_error=True)
+
+GetConsoleWindow = _kernel32.GetConsoleWindow
+GetConsoleWindow.argtypes = ()
+GetConsoleWindow.restype = wintypes.HWND
+
+GetModuleHandleW = _kernel32.GetModuleHandleW
+GetModuleHandleW.argtypes = (wintypes.LPCWSTR,)
+GetModuleHandleW.restype = wintypes.HMODULE
+
+RegisterClassW = _user32.RegisterClassW
+RegisterClassW.argtypes = (ctypes.POINTER(WNDCLASSW),)
+RegisterClassW.restype = wintypes.ATOM
+
+CreateWindowExW = _user32.CreateWindowExW
+CreateWindowExW.argtypes = (wintypes.DWORD, wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD,
+                            ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+                            wintypes.HWND, wintypes.HMENU, wintypes.HINSTANCE, wintypes.LPVOID)
+CreateWindowExW.restype = wintypes.HWND
+
+DefWindowProcW = _user32.DefWindowProcW
+DefWindowProcW.argtypes = (wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM)
+DefWindowProcW.restype = LRESULT
+
+GetMessageW = _user32.GetMessageW
+GetMessageW.argtypes = (ctypes.POINTER(wintypes.MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT)
+GetMessageW.restype = wintypes.BOOL
+
+TranslateMessage = _user32.TranslateMessage
+TranslateMessage.argtypes = (ctypes.POINTER(wintypes.MSG),)
+TranslateMessage.restype = wintypes.BOOL
+
+DispatchMessageW = _user32.DispatchMessageW
+DispatchMessageW.argtypes = (ctypes.POINTER(wintypes.MSG),)
+DispatchMessageW.restype = LRESULT
+
+WTSRegisterSessionNotification = _wtsapi32.WTSRegisterSessionNotification
+WTSRegisterSessionNotification.argtypes = (wintypes.HWND, wintypes.DWORD)
+WTSRegisterSessionNotification.restype = wintypes.BOOL
+
+def watch_session_lock(on_change) -> bool:
+    """Call on_change(locked) from a worker thread whenever this session locks or unlocks.
+
+    Creates a hidden window registered for WM_WTSSESSION_CHANGE and pumps its
+    messages in a daemon thread. Returns False if the window couldn't be set up.
+    """
+    ready = threading.Event()
+    ok = []
+
+    @WNDPROC
+    def wndproc(hwnd, msg, wparam, lparam):
+        if msg == WM_WTSSESSION_CHANGE:
+            if wparam == WTS_SESSION_LOCK:
+                on_change(True)
+            elif wparam == WTS_SESSION_UNLOCK:
+                on_change(False)
+            return 0
+        return DefWindowProcW(hwnd, msg, wparam, lparam)
+
+    def pump():
+        # The window must be created on the thread that runs its message loop.
+        try:
+            hinst = GetModuleHandleW(None)
+            wc = WNDCLASSW(lpfnWndProc=wndproc, hInstance=hinst, lpszClassName="StretchTimerSessionWatcher")
+            hwnd = None
+            if RegisterClassW(ctypes.byref(wc)):
+                hwnd = CreateWindowExW(0, wc.lpszClassName, "stretch-timer", 0, 0, 0, 0, 0,
+                                       None, None, hinst, None)
+            ok.append(bool(hwnd) and bool(WTSRegisterSessionNotification(hwnd, NOTIFY_FOR_THIS_SESSION)))
+        finally:
+            ready.set()
+        if not ok[0]:
+            return
+        msg = wintypes.MSG()
+        while GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+            TranslateMessage(ctypes.byref(msg))
+            DispatchMessageW(ctypes.byref(msg))
+
+    threading.Thread(target=pump, daemon=True).start()
+    ready.wait()
+    return bool(ok and ok[0])
@@ -1,115 +1,297 @@
 #!/usr/bin/env python3
 import argparse
+import ctypes
 import os
-import re
+import select
 import shutil
 import signal
 import subprocess
 import sys
+import threading
 import time
 import platform
 
+try:  # optional: event-driven lock detection on Linux
+    from gi.repository import GLib
+    from pydbus import SessionBus, SystemBus
+except ImportError:
+    GLib = SessionBus = SystemBus = None
+
+try:  # optional: in-process notifications on Linux via libnotify
+    import gi
+    gi.require_version("Notify", "0.7")
+    from gi.repository import Notify
+except (ImportError, ValueError):
+    Notify = None
+
 IS_WINDOWS = platform.system() == "Windows"
 IS_LINUX = platform.system() == "Linux"
 
+if IS_WINDOWS:
+    from ctypes import wintypes
+    from xml.sax.saxutils import escape
+    try:
+        import _win32
+    except (ImportError, OSError):
+        _win32 = None
+    try:  # optional: in-process toasts via the WinRT bindings
+        from winsdk.windows.data.xml.dom import XmlDocument
+        from winsdk.windows.ui.notifications import ToastNotification, ToastNotificationManager
+    except ImportError:
+        ToastNotificationManager = None
+
+# Resolve external tools once at startup instead of walking $PATH on every poll.
+_LOGINCTL = shutil.which("loginctl") if IS_LINUX else None
+_GDBUS = shutil.which("gdbus") if IS_LINUX else None
+_NOTIFY_SEND = shutil.which("notify-send") if IS_LINUX else None
+_SNORETOAST = shutil.which("snoretoast.exe") if IS_WINDOWS else None
+_POWERSHELL = (shutil.which("powershell") or shutil.which("pwsh")) if IS_WINDOWS else None
+
 # --- helpers ---
 
+_DUR_UNITS = {"s": 1, "m": 60, "h": 3600}
+
 def parse_duration(s: str, default_minutes: int) -> float:
     if not s:
         return default_minutes * 60
-    m = re.fullmatch(r"\s*(\d+)\s*([smh]?)\s*", s, re.I)
-    if not m:
+    t = s.strip()
+    i = 0
+    while i < len(t) and t[i].isdecimal():
+        i += 1
+    unit = t[i:].strip().lower() or "m"
+    if i == 0 or unit not in _DUR_UNITS:
         raise SystemExit(f"Invalid duration: {s!r} (use like 45m, 15m, 3600s)")
-    n, unit = int(m.group(1)), (m.group(2) or "m").lower()
-    if unit == "s": return float(n)
-    if unit == "m": return float(n * 60)
-    if unit == "h": return float(n * 3600)
-    raise SystemExit(f"Invalid unit in duration: {s!r}")
+    return float(int(t[:i]) * _DUR_UNITS[unit])
 
 def try_cmd(cmd):
     try:
-        return subprocess.run(cmd, check=False).returncode == 0
+        # Only the exit code matters; no pipes to set up or drain.
+        return subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                              check=False).returncode == 0
     except Exception:
         return False
 
-# --- notifications (Linux + Windows) ---
+# --- timers (Linux: one timerfd per wait instead of sleep loops) ---
 
-def notify(title: str, body: str = "") -> None:
-    if IS_LINUX:
-        if shutil.which("notify-send"):
-            subprocess.run(["notify-send", title, body], check=False)
-        else:
-            print(f"[NOTIFY] {title} - {body}", flush=True)
+class _timespec(ctypes.Structure):
+    _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+class _itimerspec(ctypes.Structure):
+    _fields_ = [("it_interval", _timespec), ("it_value", _timespec)]
+
+def _load_timerfd():
+    """Bind timerfd_create/timerfd_settime from libc, or None if unavailable."""
+    if not IS_LINUX:
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        create, settime = libc.timerfd_create, libc.timerfd_settime
+    except (OSError, AttributeError):
+        return None
+    create.argtypes = (ctypes.c_int, ctypes.c_int)
+    create.restype = ctypes.c_int
+    settime.argtypes = (ctypes.c_int, ctypes.c_int,
+                        ctypes.POINTER(_itimerspec), ctypes.POINTER(_itimerspec))
+    settime.restype = ctypes.c_int
+    return create, settime
+
+_TIMERFD = _load_timerfd()
+
+def _now() -> float:
+    # CLOCK_BOOTTIME keeps counting while the laptop is suspended; monotonic doesn't.
+    return time.clock_gettime(time.CLOCK_BOOTTIME) if IS_LINUX else time.monotonic()
+
+def _boottime_timer(seconds: float) -> int:
+    """Return a timerfd that becomes readable after `seconds`, or -1 on failure."""
+    if _TIMERFD is None:
+        return -1
+    create, settime = _TIMERFD
+    fd = create(time.CLOCK_BOOTTIME, os.O_CLOEXEC)
+    if fd < 0:
+        return -1
+    sec = int(seconds)
+    nsec = max(int((seconds - sec) * 1e9), 0 if sec else 1)  # all-zero would disarm it
+    spec = _itimerspec(it_value=_timespec(sec, nsec))
+    if settime(fd, 0, ctypes.byref(spec), None) < 0:
+        os.close(fd)
+        return -1
+    return fd
+
+def _nonblocking_pipe() -> tuple[int, int]:
+    r, w = os.pipe()
+    os.set_blocking(r, False)
+    os.set_blocking(w, False)
+    return r, w
+
+def _drain(fd: int) -> None:
+    try:
+        while os.read(fd, 512):
+            pass
+    except BlockingIOError:
+        pass
+
+class _AbortEvent(threading.Event):
+    """threading.Event that can also be select()ed on via a self-pipe (Linux)."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._r = self._w = -1
+        if _TIMERFD is not None:
+            self._r, self._w = _nonblocking_pipe()
+
+    def fileno(self) -> int:
+        return self._r
+
+    def set(self) -> None:
+        super().set()
+        if self._w >= 0:
+            try:
+                os.write(self._w, b"x")
+            except BlockingIOError:
+                pass  # pipe already full → already readable
+
+    def clear(self) -> None:
+        super().clear()
+        if self._r >= 0:
+            _drain(self._r)
+
+# Read end of the signal.set_wakeup_fd() pipe, once installed by main().
+_wakeup_r = -1
+
+def _install_signal_wakeup() -> None:
+    """Make exit signals wake the timerfd select() even if they land just before it blocks."""
+    global _wakeup_r
+    if _TIMERFD is None:
         return
+    r, w = _nonblocking_pipe()
+    signal.set_wakeup_fd(w)
+    _wakeup_r = r
+
+# --- notifications (Linux + Windows) ---
+
+def _init_libnotify():
+    """One reusable libnotify notification, or None to fall back to notify-send."""
+    if not IS_LINUX or Notify is None:
+        return None
+    try:
+        if not Notify.init("stretch-timer"):
+            return None
+        return Notify.Notification.new("", "", None)
+    except Exception:
+        return None
+
+_notifier = _init_libnotify()
+
+# Unpackaged apps can't post toasts under their own AppUserModelID; borrow PowerShell's.
+_TOAST_APP_ID = r"{1AC14E77-02E7-4E5D-B744-2EB1AE5198B7}\WindowsPowerShell\v1.0\powershell.exe"
+_TOAST_XML = ('<toast><visual><binding template="ToastGeneric">'
+              '<text>{}</text><text>{}</text></binding></visual></toast>')
 
-    if IS_WINDOWS:
-        # Try SnoreToast (portable toast exe) if present on PATH
-        if shutil.which("snoretoast.exe"):
-            subprocess.run(["snoretoast.exe", "-t", title, "-m", body], check=False)
+def _init_toaster():
+    """A WinRT toast notifier, or None to fall back to SnoreToast/PowerShell."""
+    if not IS_WINDOWS or ToastNotificationManager is None:
+        return None
+    try:
+        return ToastNotificationManager.create_toast_notifier(_TOAST_APP_ID)
+    except Exception:
+        return None
+
+_toaster = _init_toaster()
+
+def _notify_console(title: str, body: str = "") -> None:
+    print(f"[NOTIFY] {title} - {body}", flush=True)
+
+def _notify_linux(title: str, body: str = "") -> None:
+    if _notifier is not None:
+        try:
+            _notifier.update(title, body, None)
+            _notifier.show()
             return
-        # Try PowerShell BurntToast module if available
-        ps = shutil.which("powershell") or shutil.which("pwsh")
-        if ps:
-            cmd = [
-                ps, "-NoProfile", "-Command",
-                # Fire-and-forget toast; ignore errors if BurntToast isn't installed
-                "Try { "
-                "Import-Module BurntToast -ErrorAction Stop; "
-                f"New-BurntToastNotification -Text @('{title}','{body}') "
-                "} Catch {{}}"
-            ]
-            subprocess.run(cmd, check=False)
+        except Exception:
+            pass  # e.g. no notification daemon yet; try notify-send
+    if _NOTIFY_SEND:
+        subprocess.run([_NOTIFY_SEND, title, body], check=False)
+    else:
+        _notify_console(title, body)
+
+def _notify_windows(title: str, body: str = "") -> None:
+    # WinRT toast in-process: no PowerShell/.NET start-up per notification
+    if _toaster is not None:
+        try:
+            doc = XmlDocument()
+            doc.load_xml(_TOAST_XML.format(escape(title), escape(body)))
+            _toaster.show(ToastNotification(doc))
             return
-        # Last resort: console
-        print(f"[NOTIFY] {title} - {body}", flush=True)
+        except Exception:
+            pass
+    # Try SnoreToast (portable toast exe) if present on PATH
+    if _SNORETOAST:
+        subprocess.run([_SNORETOAST, "-t", title, "-m", body], check=False)
         return
+    # Try PowerShell BurntToast module if available
+    if _POWERSHELL:
+        cmd = [
+            _POWERSHELL, "-NoProfile", "-Command",
+            # Fire-and-forget toast; ignore errors if BurntToast isn't installed
+            "Try { "
+            "Import-Module BurntToast -ErrorAction Stop; "
+            f"New-BurntToastNotification -Text @('{title}','{body}') "
+            "} Catch {{}}"
+        ]
+        subprocess.run(cmd, check=False)
+        return
+    # Last resort: console
+    _notify_console(title, body)
 
-    # Other OSes: console fallback
-    print(f"[NOTIFY] {title} - {body}", flush=True)
+# Pick the platform implementation once instead of branching on every call.
+notify = _notify_linux if IS_LINUX else _notify_windows if IS_WINDOWS else _notify_console
 
 # --- lock / lock-state (Linux + Windows) ---
 
-def lock_session() -> bool:
-    if IS_LINUX:
-        # Try a few common lock methods; first one that works wins.
-        if try_cmd(["loginctl", "lock-session"]): return True
-        if try_cmd(["gdbus","call","--session","--dest","org.gnome.ScreenSaver",
-                    "--object-path","/org/gnome/ScreenSaver",
-                    "--method","org.gnome.ScreenSaver.Lock"]): return True
-        if try_cmd(["gnome-screensaver-command","-l"]): return True
-        if try_cmd(["xdg-screensaver","lock"]): return True
-        if try_cmd(["dm-tool","lock"]): return True
-        if try_cmd(["xscreensaver-command","-lock"]): return True
-        return False
+# A few common lock methods, tried in order; only the installed ones are kept.
+_LOCK_CMDS = (
+    ["loginctl", "lock-session"],
+    ["gdbus","call","--session","--dest","org.gnome.ScreenSaver",
+     "--object-path","/org/gnome/ScreenSaver",
+     "--method","org.gnome.ScreenSaver.Lock"],
+    ["gnome-screensaver-command","-l"],
+    ["xdg-screensaver","lock"],
+    ["dm-tool","lock"],
+    ["xscreensaver-command","-lock"],
+)
+_LOCKERS = [[path, *cmd[1:]] for cmd in _LOCK_CMDS if (path := shutil.which(cmd[0]))] if IS_LINUX else []
+_locker = None  # the first one that worked; tried first from then on
+
+def _lock_linux() -> bool:
+    global _locker
+    if _locker is not None and try_cmd(_locker):
+        return True
+    for cmd in _LOCKERS:
+        if cmd is not _locker and try_cmd(cmd):
+            _locker = cmd
+            return True
+    return False
 
-    if IS_WINDOWS:
-        # Use Win32 API: LockWorkStation
-        try:
-            import ctypes
-            ok = ctypes.windll.user32.LockWorkStation()
-            return bool(ok)
-        except Exception:
-            # Fallback via rundll32 (rarely needed)
-            return try_cmd(["rundll32.exe", "user32.dll,LockWorkStation"])
+def _lock_windows() -> bool:
+    # Use Win32 API: LockWorkStation
+    try:
+        return bool(_win32.LockWorkStation())
+    except Exception:
+        # Fallback via rundll32 (rarely needed)
+        return try_cmd(["rundll32.exe", "user32.dll,LockWorkStation"])
 
+def _lock_unsupported() -> bool:
     return False
 
+lock_session = _lock_linux if IS_LINUX else _lock_windows if IS_WINDOWS else _lock_unsupported
+
 # --- lock state helpers ---
 
 def _windows_input_desktop_name() -> str | None:
     """Return the current input desktop name ('Default' when unlocked, 'Winlogon' when locked)."""
     try:
-        import ctypes
-        from ctypes import wintypes
-
-        UOI_NAME = 2
-        DESKTOP_READOBJECTS = 0x0001
-        DESKTOP_SWITCHDESKTOP = 0x0100
-
-        user32 = ctypes.windll.user32
-
         # Open the desktop currently receiving user input
-        hdesk = user32.OpenInputDesktop(0, False, DESKTOP_READOBJECTS | DESKTOP_SWITCHDESKTOP)
+        hdesk = _win32.OpenInputDesktop(0, False, _win32.DESKTOP_READOBJECTS | _win32.DESKTOP_SWITCHDESKTOP)
         if not hdesk:
             # If we cannot open the input desktop, assume locked (returns None to let caller decide)
             return None
@@ -117,79 +299,183 @@ def _windows_input_desktop_name() -> str | None:
         try:
             # Query size
             needed = wintypes.DWORD(0)
-            user32.GetUserObjectInformationW(hdesk, UOI_NAME, None, 0, ctypes.byref(needed))
+            _win32.GetUserObjectInformationW(hdesk, _win32.UOI_NAME, None, 0, ctypes.byref(needed))
             buf = (ctypes.c_wchar * (needed.value // ctypes.sizeof(ctypes.c_wchar)))()
-            if not user32.GetUserObjectInformationW(hdesk, UOI_NAME, buf, ctypes.sizeof(buf), ctypes.byref(needed)):
+            if not _win32.GetUserObjectInformationW(hdesk, _win32.UOI_NAME, buf, ctypes.sizeof(buf), ctypes.byref(needed)):
                 return None
             return ctypes.wstring_at(buf)
         finally:
-            user32.CloseDesktop(hdesk)
+            _win32.CloseDesktop(hdesk)
     except Exception:
         return None
 
-def session_locked() -> bool:
-    """Best-effort check if the current session is locked."""
-    if IS_LINUX:
+def _session_locked_linux() -> bool:
+    """Ask loginctl/gdbus whether the session is locked right now."""
+    sess = os.environ.get("XDG_SESSION_ID")
+    if _LOGINCTL and sess:
+        try:
+            r = subprocess.run(
+                [_LOGINCTL, "show-session", sess, "-p", "LockedHint"],
+                capture_output=True, text=True, check=False
+            )
+            if "LockedHint=yes" in r.stdout:
+                return True
+            if "LockedHint=no" in r.stdout:
+                return False
+        except Exception:
+            pass
+    if _GDBUS:
+        try:
+            r = subprocess.run(
+                [_GDBUS,"call","--session","--dest","org.gnome.ScreenSaver",
+                 "--object-path","/org/gnome/ScreenSaver",
+                 "--method","org.gnome.ScreenSaver.GetActive"],
+                capture_output=True, text=True, check=False
+            )
+            out = (r.stdout or "").lower()
+            if "true" in out:  # " (true, )"
+                return True
+            if "false" in out:
+                return False
+        except Exception:
+            pass
+    return False  # unknown → assume unlocked
+
+def _session_locked_windows() -> bool:
+    """Check the input desktop to see whether the session is locked right now."""
+    name = _windows_input_desktop_name()
+    # Heuristic:
+    #   - 'Default' → unlocked
+    #   - 'Winlogon' → locked
+    #   - None (couldn't query) → assume locked? We keep behavior consistent with Linux: assume unlocked
+    if name is None:
+        return False
+    name = name.strip()
+    if name.lower() == "winlogon":
+        return True
+    if name.lower() == "default":
+        return False
+    # If some other desktop is active (rare), be conservative and treat as unlocked
+    return False
+
+def _session_locked_unknown() -> bool:
+    # Other OSes: assume unlocked
+    return False
+
+_poll_session_locked = (_session_locked_linux if IS_LINUX else
+                        _session_locked_windows if IS_WINDOWS else _session_locked_unknown)
+# Whether polling can tell anything at all (Linux needs loginctl or gdbus).
+_CAN_POLL_LOCK = bool(_LOGINCTL or _GDBUS) if IS_LINUX else True
+
+# --- event-driven lock watcher (Linux: pydbus, Windows: WTS notifications) ---
+
+# Set when the session gets locked (by the watcher) or on an exit signal;
+# the focus/grace waits block on it instead of waking every second.
+_abort = _AbortEvent()
+
+class LockWatcher:
+    """Track lock state from lock/unlock events instead of polling once a second."""
+
+    def __init__(self) -> None:
+        self.locked = False
+        self.unlocked_event = threading.Event()
+        self.unlocked_event.set()
+        self._session = None  # logind Session proxy, when available
+
+    def start(self) -> bool:
+        """Subscribe to lock/unlock events; False if there is nothing to listen to."""
+        if IS_WINDOWS:
+            if _win32 is None or not _win32.watch_session_lock(self._set_locked):
+                return False
+        elif not self._subscribe_dbus():
+            return False
+
+        # One-shot probe for the state we start in; events keep it current afterwards.
+        self._set_locked(self._probe())
+        return True
+
+    def _subscribe_dbus(self) -> bool:
+        if GLib is None:
+            return False
+        subscribed = False
+        try:
+            session = SessionBus()
+            if session.dbus.NameHasOwner("org.gnome.ScreenSaver"):
+                session.subscribe(iface="org.gnome.ScreenSaver", signal="ActiveChanged",
+                                  signal_fired=self._on_active_changed)
+                subscribed = True
+        except Exception:
+            pass
+
+        # logind's LockedHint is the lock *state*. Its Lock/Unlock signals are only
+        # requests to the screen locker (Unlock never fires on a password unlock),
+        # so they must not drive self.locked.
         sess = os.environ.get("XDG_SESSION_ID")
-        if shutil.which("loginctl") and sess:
+        if sess:
             try:
-                r = subprocess.run(
-                    ["loginctl", "show-session", sess, "-p", "LockedHint"],
-                    capture_output=True, text=True, check=False
-                )
-                if "LockedHint=yes" in r.stdout:
-                    return True
-                if "LockedHint=no" in r.stdout:
-                    return False
+                system = SystemBus()
+                path = system.get(".login1").GetSession(sess)
+                self._session = system.get(".login1", path)
+                self._session.PropertiesChanged.connect(self._on_session_changed)
+                subscribed = True
             except Exception:
-                pass
-        if shutil.which("gdbus"):
+                self._session = None
+
+        if not subscribed:
+            return False
+        threading.Thread(target=GLib.MainLoop().run, daemon=True).start()
+        return True
+
+    def _probe(self) -> bool:
+        """Read the current lock state directly (no loginctl fork when logind is on the bus)."""
+        if self._session is not None:
             try:
-                r = subprocess.run(
-                    ["gdbus","call","--session","--dest","org.gnome.ScreenSaver",
-                     "--object-path","/org/gnome/ScreenSaver",
-                     "--method","org.gnome.ScreenSaver.GetActive"],
-                    capture_output=True, text=True, check=False
-                )
-                out = (r.stdout or "").lower()
-                if "true" in out:  # " (true, )"
-                    return True
-                if "false" in out:
-                    return False
+                return bool(self._session.LockedHint)
             except Exception:
                 pass
-        return False  # unknown → assume unlocked
-
-    if IS_WINDOWS:
-        name = _windows_input_desktop_name()
-        # Heuristic:
-        #   - 'Default' → unlocked
-        #   - 'Winlogon' → locked
-        #   - None (couldn't query) → assume locked? We keep behavior consistent with Linux: assume unlocked
-        if name is None:
-            return False
-        name = name.strip()
-        if name.lower() == "winlogon":
-            return True
-        if name.lower() == "default":
-            return False
-        # If some other desktop is active (rare), be conservative and treat as unlocked
-        return False
+        return _poll_session_locked()
 
-    # Other OSes: assume unlocked
-    return False
+    def _on_session_changed(self, iface, changed, invalidated) -> None:
+        if "LockedHint" in changed:
+            self._set_locked(bool(changed["LockedHint"]))
+
+    def _on_active_changed(self, sender, obj, iface, signal, params) -> None:
+        self._set_locked(bool(params[0]))
+
+    def _set_locked(self, locked: bool) -> None:
+        self.locked = locked
+        if locked:
+            self.unlocked_event.clear()
+            _abort.set()
+        else:
+            self.unlocked_event.set()
+
+_watcher: LockWatcher | None = None
+
+def _has_console() -> bool:
+    if _win32 is not None:
+        return bool(_win32.GetConsoleWindow())
+    return sys.stdin is not None  # pythonw.exe runs without one
+
+# Ctrl+C can't interrupt Event.wait on Windows, so long waits wake up once a second
+# there, but only when there is a console to press Ctrl+C in (not under pythonw.exe).
+_CTRL_C_SLICE = 1.0 if IS_WINDOWS and _has_console() else None
+
+def session_locked() -> bool:
+    """Best-effort check if the current session is locked."""
+    if _watcher is not None:
+        return _watcher.locked
+    return _poll_session_locked()
 
 def wait_until_unlocked(poll_interval: float = 1.0) -> None:
     """Block until the session is unlocked (best-effort)."""
+    if _watcher is not None:
+        while not _watcher.unlocked_event.wait(timeout=_CTRL_C_SLICE):
+            pass
+        return
+
     # If we have *some* way to tell lock state, poll it; otherwise just return
-    can_detect = True
-    if IS_LINUX and not (shutil.which("loginctl") or shutil.which("gdbus")):
-        can_detect = False
-    if IS_WINDOWS:
-        # We try to detect via input desktop; if even that returns None every time, we'll still loop a bit
-        can_detect = True
-
-    if not can_detect:
+    if not _CAN_POLL_LOCK:
         return
 
     while session_locked():
@@ -197,37 +483,69 @@ def wait_until_unlocked(poll_interval: float = 1.0) -> None:
 
 # --- one-cycle runner that aborts on manual lock ---
 
+def _wait_abort(seconds: float) -> bool:
+    """Wait up to `seconds` for _abort; return True if it was set."""
+    if seconds <= 0:
+        return _abort.is_set()
+    tfd = _boottime_timer(seconds)
+    if tfd < 0:
+        if _CTRL_C_SLICE is None:
+            return _abort.wait(timeout=seconds)
+        deadline = _now() + seconds
+        while (remaining := deadline - _now()) > 0:
+            if _abort.wait(timeout=min(_CTRL_C_SLICE, remaining)):
+                return True
+        return False
+    fds = [tfd, _abort] + ([_wakeup_r] if _wakeup_r >= 0 else [])
+    try:
+        while True:
+            readable, _, _ = select.select(fds, [], [])
+            if _wakeup_r in readable:
+                # The signal's Python handler (graceful_exit) runs as soon as we're
+                # back in bytecode; a stale byte from an already-handled one just
+                # sends us back into select.
+                _drain(_wakeup_r)
+            if tfd in readable or _abort in readable:
+                break
+    finally:
+        os.close(tfd)
+    return _abort.is_set()
+
+def _sleep_unless_locked(seconds: float, poll_interval: float = 10.0) -> bool:
+    """Sleep for `seconds`; return True early if the session gets locked."""
+    if _watcher is not None:
+        return _watcher.locked or _wait_abort(seconds)
+
+    # No lock signals available: fall back to polling the lock state. Noticing a
+    # manual lock a few seconds late is fine; forking loginctl every second isn't.
+    deadline = _now() + seconds
+    while (remaining := deadline - _now()) > 0:
+        if _wait_abort(min(poll_interval, remaining)):
+            return True
+        if session_locked():
+            return True
+    return False
+
 def run_one_cycle(focus_s: float, grace_s: float) -> None:
     notify("Focus started ✅", f"Focus {int(focus_s // 60)}m, then {int(grace_s // 60)}m grace.")
     print(f"Focus for {int(focus_s)}s → warn → {int(grace_s)}s → lock", flush=True)
 
     # Focus
-    t0 = time.monotonic()
-    while True:
-        if session_locked():  # manual lock detected
-            print("Detected manual lock during focus; waiting for unlock…", flush=True)
-            wait_until_unlocked()
-            print("Unlocked. Restarting timer…", flush=True)
-            return  # abort this cycle and let caller restart fresh
-        remaining = focus_s - (time.monotonic() - t0)
-        if remaining <= 0:
-            break
-        time.sleep(min(1.0, max(0.0, remaining)))
+    _abort.clear()
+    if _sleep_unless_locked(focus_s):  # manual lock detected
+        print("Detected manual lock during focus; waiting for unlock…", flush=True)
+        wait_until_unlocked()
+        print("Unlocked. Restarting timer…", flush=True)
+        return  # abort this cycle and let caller restart fresh
 
     notify("Time to take a break 🤸", f"You’ve hit your focus limit. {int(grace_s // 60)}m until auto-lock.")
 
     # Grace
-    g0 = time.monotonic()
-    while True:
-        if session_locked():             # manual lock during grace
-            print("Detected manual lock during grace; waiting for unlock…", flush=True)
-            wait_until_unlocked()
-            print("Unlocked. Restarting timer…", flush=True)
-            return
-        remaining = grace_s - (time.monotonic() - g0)
-        if remaining <= 0:
-            break
-        time.sleep(min(1.0, max(0.0, remaining)))
+    if _sleep_unless_locked(grace_s):  # manual lock during grace
+        print("Detected manual lock during grace; waiting for unlock…", flush=True)
+        wait_until_unlocked()
+        print("Unlocked. Restarting timer…", flush=True)
+        return
 
     # Auto-lock (script-initiated)
     if lock_session():
@@ -242,6 +560,7 @@ def run_one_cycle(focus_s: float, grace_s: float) -> None:
 
 def graceful_exit(signum, frame):
     print(f"\nReceived signal {signum}; exiting.", flush=True)
+    _abort.set()
     sys.exit(0)
 
 def main():
@@ -259,9 +578,15 @@ def main():
     try:
         signal.signal(signal.SIGINT, graceful_exit)
         signal.signal(signal.SIGTERM, graceful_exit)
+        _install_signal_wakeup()
     except Exception:
         pass
 
+    global _watcher
+    watcher = LockWatcher()
+    if watcher.start():
+        _watcher = watcher
+
     # loop forever: restart after manual or auto unlock
     while True:
         run_one_cycle(focus_s, grace_s)